@@ -1,30 +1,34 @@
 #!/usr/bin/env python3
 """Solar Generation from the Solaredge API."""
 
-from datetime import datetime
+from typing import Iterator
 
 from solaredge.api import SolaredgeClient
-from utilities import InfluxConnection, get_env, get_logger
+from utilities import InfluxConnection, get_env, get_logger, influx_epoch, month_label, write_batches
+
+
+def energy_lines(measurement_name: str, site: str, values: list, hourly: bool) -> Iterator[str]:
+    """Formats the energy values for a site as influxdb line protocol points with the time in seconds."""
+    prefix = f"{measurement_name},site_number={site} "
+    for data in values:
+        hour = f",hour={data.date.hour}i" if hourly else ""
+        yield (
+            f"{prefix}"
+            f"generated={float(data.value)},"
+            f'month="{month_label(data.date)}"'
+            f"{hour} "
+            f"{influx_epoch(data.date)}"
+        )
 
 
 def add_energy_data(client, connection, time_unit, measurement_name, logger) -> None:
     logger.info(f"Adding Solaredge {time_unit.lower()} information to influxdb")
     client.set_time_unit(time_unit)
-    influx_data = [
-        {
-            'measurement': measurement_name,
-            'time': datetime.strftime(data.date, '%Y-%m-%dT%H:%MZ'),
-            'tags': {'site_number': site},
-            'fields': {
-                'generated': float(data.value),
-                'month': data.date.strftime("%b %Y"),
-                **({'hour': int(data.date.hour)} if time_unit == "HOUR" else {})
-            }
-        }
-        for site in client.site_list
-        for data in client.get_energy(site_id=site).values
-    ]
-    connection.write_points(influx_data)
+    for site in client.site_list:
+        # The points are sent as line protocol so influxdb does not have to encode them as JSON first
+        influx_data = energy_lines(measurement_name, site, client.get_energy(site_id=site).values,
+                                   hourly=time_unit == "HOUR")
+        write_batches(connection, influx_data, time_precision='s', protocol='line')
 
 def main() -> None:
     """Load historical data into influxdb."""
@@ -0,0 +1,35 @@
+"""Aggregations over the columnar NumPy views of the Solaredge API data.
+
+These functions operate on the arrays returned by the columns methods, for example
+EnergyData.columns() or SolaredgeClient.get_inverter_telemetry_columns(), so that
+sums and rollups run as NumPy loops rather than over lists of dataclasses.
+This module requires the optional numpy dependency.
+"""
+import numpy
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def sum_values(values: numpy.ndarray) -> float:
+    """Return the sum of the values, ignoring missing (NaN) values."""
+    return float(numpy.nansum(values))
+
+
+def daily_rollup(timestamps: numpy.ndarray, values: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Return the days present in the timestamps and the total of the values for each day.
+    Missing (NaT) timestamps and missing (NaN) values are ignored."""
+    present = ~numpy.isnat(timestamps)
+    timestamps, values = timestamps[present], numpy.asarray(values)[present]
+    days, index = numpy.unique(timestamps.astype("datetime64[D]"), return_inverse=True)
+    totals = numpy.bincount(index, weights=numpy.nan_to_num(values), minlength=len(days))
+    return days, totals
+
+
+def moving_average(values: numpy.ndarray, window: int) -> numpy.ndarray:
+    """Return the moving average of the values over the given window.
+    The result has one entry for each complete window, windows containing a missing (NaN) value are NaN."""
+    if window < 1:
+        raise ValueError("The moving average window must be at least 1")
+    values = numpy.asarray(values, dtype="f8")
+    if window > len(values):
+        return numpy.empty(0)
+    return sliding_window_view(values, window).mean(axis=1)
@@ -2,16 +2,31 @@
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime, timedelta  # noqa
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 import solaredge.const
-from solaredge.const import APIList, Solaredge
+from solaredge.apiconstruct import Endpoint
+from solaredge.const import APIList
 
 # Only export the Solaredge Client
 __all__ = ["SolaredgeClient"]
 
+# Maximum number of concurrent requests to the Solaredge API, which rate limits each API key
+MAX_REQUESTS = 4
+# Retry transient failures of the Solaredge API, the final error status is raised by raise_for_status
+API_RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+
 
 class SolaredgeClient:
     """This class enables queries to be performed using the Solaredge REST API"""
@@ -24,10 +39,16 @@ class SolaredgeClient:
         assert apikey is not None
         self.logger = logging.getLogger(__name__)
         self.logger.info("Initialising Solaredge API Client")
-        self._api = Solaredge
+        # Each client has its own arguments and parameters so that dates, the site and the API key
+        # set by one client are not shared with clients created later in the same process
+        self._api = replace(solaredge.const.Solaredge,
+                            arguments=solaredge.const.APIArguments(),
+                            parameters=solaredge.const.APIParameters())
         # Solaredge API uses the API key as a parameter
         self._api.parameters.api_key = apikey
         self._session = requests.Session()
+        # The connections to the API host are kept alive and shared by concurrent calls
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=API_RETRIES))
         self._initialize_data()
 
     def __enter__(self) -> object:
@@ -46,13 +67,15 @@ class SolaredgeClient:
         # Create a dataclass for locally stored information that is retained for the session
         self._storeddata = solaredge.const.SummaryData()
         # Store the site information
-        self._storeddata.sites = self.get_sites()
-        for site in self._storeddata.sites:
+        sites = self.get_sites()
+        for site in sites:
             self.logger.info(f"Found a site with id: {site.id}")
+        # Store the inventory information for each site, requesting the sites concurrently
+        with ThreadPoolExecutor(max_workers=MAX_REQUESTS) as executor:
+            self._storeddata.inventories.extend(executor.map(self.get_site_inventory, [site.id for site in sites]))
+        if sites:
             # Set the site ID - with a single site this will remain set
-            self._api.arguments.siteid = site.id
-            # Store the inventory information for each site
-            self._storeddata.inventories.append(self.get_site_inventory(site.id))
+            self._api.arguments.siteid = sites[-1].id
         for data in self._storeddata.inventories:
             for inverter in data.inverters:
                 self.logger.info(f"Found an inverter with SN: {inverter.SN}")
@@ -80,17 +103,17 @@ class SolaredgeClient:
         """
         self._api.parameters.startTime: str = (
             datetime.now() - timedelta(days=start)
-        ).strftime(f"{Solaredge.constants.DateFormat.value} 00:00:00")
+        ).strftime(f"{self._api.constants['DateFormat']} 00:00:00")
         self._api.parameters.endTime: str = (
             datetime.now() - timedelta(days=end)
-        ).strftime(f"{Solaredge.constants.DateFormat.value} 23:59:59")
+        ).strftime(f"{self._api.constants['DateFormat']} 23:59:59")
 
     def set_dates(self, start: int = 1, end: int = 0) -> None:
         self._api.parameters.startDate = (
             datetime.now() - timedelta(days=start)
-        ).strftime(Solaredge.constants.DateFormat.value)
+        ).strftime(self._api.constants["DateFormat"])
         self._api.parameters.endDate = (datetime.now() - timedelta(days=end)).strftime(
-            Solaredge.constants.DateFormat.value
+            self._api.constants["DateFormat"]
         )
 
     def set_time_unit(self, unit: solaredge.const.TimeUnit) -> None:
@@ -101,13 +124,19 @@ class SolaredgeClient:
         self._api.parameters.timeUnit = unit
 
     def get_current_version(self) -> solaredge.const.Version:
-        return self._call_api(api=APIList.CurrentVersion).version
+        return self._call_api(api=APIList.CurrentVersion)
 
     def get_supported_versions(self) -> list[solaredge.const.Version]:
-        return self._call_api(api=APIList.SupportedVersions).supported
+        # The supported versions do not change during a session so they are requested once
+        if not self._storeddata.versions:
+            self._storeddata.versions = self._call_api(api=APIList.SupportedVersions)
+        return self._storeddata.versions
 
     def get_sites(self) -> list[solaredge.const.Site]:
-        return self._call_api(api=APIList.Sites).sites.site
+        # The sites are stored when the client is initialised and reused after that
+        if not self._storeddata.sites:
+            self._storeddata.sites = self._call_api(api=APIList.Sites).site
+        return self._storeddata.sites
     
     def _set_site_id(self, site_id: str | None) -> None:
         if site_id is not None:
@@ -115,23 +144,23 @@ class SolaredgeClient:
 
     def get_site_details(self, site_id: str = None) -> solaredge.const.Site:
         self._set_site_id(site_id)
-        return self._call_api(api=APIList.SiteInfo).details
+        return self._call_api(api=APIList.SiteInfo)
 
     def get_data_period(self, site_id: str = None) -> solaredge.const.DataPeriod:
         self._set_site_id(site_id)
-        return self._call_api(api=APIList.SiteDataPeriod).dataPeriod
+        return self._call_api(api=APIList.SiteDataPeriod)
 
     def get_site_overview(self, site_id: str = None) -> solaredge.const.OverviewData:
         self._set_site_id(site_id)
-        return self._call_api(api=APIList.SiteOverview).overview
+        return self._call_api(api=APIList.SiteOverview)
 
     def get_energy(self, site_id: str = None) -> solaredge.const.EnergyData:
         self._set_site_id(site_id)
-        return self._call_api(api=APIList.SiteEnergy).energy
+        return self._call_api(api=APIList.SiteEnergy)
 
     def get_energy_details(self, site_id: str = None) -> solaredge.const.DetailData:
         self._set_site_id(site_id)
-        return self._call_api(api=APIList.EnergyDetails).energyDetails
+        return self._call_api(api=APIList.EnergyDetails)
 
     def get_power(self, site_id: str = None) -> solaredge.const.PowerData:
         """Gets the power data from the Solaredge REST API
@@ -141,7 +170,7 @@ class SolaredgeClient:
             solaredge.const.PowerData
         """        
         self._set_site_id(site_id)
-        return self._call_api(api=APIList.Power).power
+        return self._call_api(api=APIList.Power)
 
     def get_power_details(self, site_id: str = None) -> solaredge.const.DetailData:
         """Gets the power details from the Solaredge REST API
@@ -151,7 +180,7 @@ class SolaredgeClient:
             solaredge.const.PowerDetailData
         """
         self._set_site_id(site_id)
-        return self._call_api(api=APIList.PowerDetails).powerDetails
+        return self._call_api(api=APIList.PowerDetails)
 
     def get_power_flow(self, site_id: str = None) -> solaredge.const.SiteCurrentPowerFlow:
         """Get the current power flow data for a specific site.
@@ -161,25 +190,29 @@ class SolaredgeClient:
             The current power flow data for the specified site.
         """
         self._set_site_id(site_id)
-        return self._call_api(api=APIList.PowerFlow).SiteCurrentPowerFlow
+        return self._call_api(api=APIList.PowerFlow)
 
     def get_storage(self, site_id: str = None) -> solaredge.const.StorageData:
         self._set_site_id(site_id)
-        return self._call_api(api=APIList.Storage).storageData
+        return self._call_api(api=APIList.Storage)
 
     def get_site_components(self, site_id: str = None) -> list[solaredge.const.ComponentEntry]:
         self._set_site_id(site_id)
         results = self._call_api(api=APIList.Components)
-        for entry in results.reporters.list:
+        for entry in results.list:
             entry.site = self._api.arguments.siteid
-        return results.reporters.list
+        return results.list
 
     def get_site_inventory(self, site_id: str = None) -> solaredge.const.InventoryData:
-        self._set_site_id(site_id)
-        results = self._call_api(api=APIList.Inventory)
+        # The site ID is passed to the request explicitly so that sites may be requested concurrently
+        arguments = self._api.arguments
+        if site_id is not None:
+            self._set_site_id(site_id)
+            arguments = replace(arguments, siteid=site_id)
+        results = self._call_api(api=APIList.Inventory, arguments=arguments)
         # Add the site ID to the Inventory data for easier handling
-        results.Inventory.site = self._api.arguments.siteid
-        return results.Inventory
+        results.site = arguments.siteid
+        return results
 
     def get_inverters(self, site_id: str = None) -> list[solaredge.const.Inverter]:
         results = self.get_site_inventory(site_id)
@@ -190,37 +223,51 @@ class SolaredgeClient:
 
     def get_env_benefits(self, site_id: str = None) -> solaredge.const.EnvBenefits:
         self._set_site_id(site_id)
-        return self._call_api(api=APIList.SiteBenefits).envBenefits
+        return self._call_api(api=APIList.SiteBenefits)
 
     def get_timeframe_energy(self, site_id: str = None) -> solaredge.const.TimeFrameEnergyData:
         self._set_site_id(site_id)
-        return self._call_api(api=APIList.SiteEnergyTimeframe).timeFrameEnergy
+        return self._call_api(api=APIList.SiteEnergyTimeframe)
 
     def get_inverter_telemetry(self, serial: str = None) -> list[solaredge.const.Telemetry]:
+        """Gets the inverter telemetry from the Solaredge REST API.
+        The serial number is passed to the request explicitly so that calls for different
+        inverters may be made concurrently from multiple threads.
+        Args:
+            serial (str): The serial number of the inverter to be used for the query
+        Returns:
+            list[solaredge.const.Telemetry]
+        """
+        arguments = self._api.arguments
         if serial is not None:
             self._api.arguments.serialnumber = serial
-        if self._api.arguments.serialnumber is None:
-            return []            
-        return self._call_api(api=APIList.InverterData).data.telemetries
+            arguments = replace(arguments, serialnumber=serial)
+        if arguments.serialnumber is None:
+            return []
+        return self._call_api(api=APIList.InverterData, arguments=arguments).telemetries
 
-    def _call_api(self, api: solaredge.const.APIList = APIList.Sites, sample=False) -> object:
-        """Initialise the arguments required to call one of the REST APIs and then call it returning the results."""
+    def get_inverter_telemetry_columns(self, serial: str = None) -> dict:
+        """Gets the inverter telemetry as columns of NumPy arrays rather than a list of dataclasses.
+        Args:
+            serial (str): The serial number of the inverter to be used for the query
+        Returns:
+            A dict of NumPy arrays keyed by the names in solaredge.const.TELEMETRY_COLUMNS
+        """
+        return solaredge.const.telemetry_columns(self.get_inverter_telemetry(serial))
+
+    def _call_api(self, api: Endpoint = APIList.Sites, sample=False,
+                  arguments: solaredge.const.APIArguments = None) -> object:
+        """Initialise the arguments required to call one of the REST APIs and then call it returning the results.
+        The arguments default to those stored on the client."""
+        if arguments is None:
+            arguments = self._api.arguments
         if sample:
             self.logger.info(f"Processing sample json for: {api.name}")
-        # Create a dictionary entry for the arguments required by the endpoint
         self.logger.info(f"Calling API endpoint: {api.name}")
-        argumentlist = {
-            entry.value: getattr(self._api.arguments, entry.value)
-            for entry in api.value.arguments
-        }            
         # Create parameter list from the api definition where the parameter has been set
-        params = {
-            entry.value: getattr(self._api.parameters, entry.value)
-            for entry in api.value.parms
-            if getattr(self._api.parameters, entry.value) is not None
-        }
-        # Create a URL from the supplied information        
-        url = f"{self._api.url}/{api.value.endpoint.format(**argumentlist)}"                    
+        params = api.params(self._api.parameters)
+        # Create a URL from the supplied information using the arguments required by the endpoint
+        url = f"{self._api.url}/{api.path(arguments)}"
         # Call the API endpoint and return the results parsing with the defined dataclass
         try:
             results = self._session.get(url=url, params=params, timeout=60)
@@ -228,7 +275,8 @@ class SolaredgeClient:
         except requests.exceptions.RequestException as err:
             self.logger.error(f"Requests error encountered: {err}")
             raise err        
-        self.logger.debug(
-            f"Formatted API results:\n {json.dumps(results.json(), indent=2)}"
-        )
-        return api.value.response(**results.json())
+        # Decode the response bytes once, orjson is used where it is installed
+        body = json_loads(results.content)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Formatted API results:\n {json.dumps(body, indent=2)}")
+        return api.parse(body)
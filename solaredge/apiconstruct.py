@@ -4,91 +4,280 @@ RESTClient: The RESTClient data class represents the configuration for making AP
 It includes information such as the API URL, authentication method, supported API endpoints, arguments, parameters,
 and constants. """
 
+import sys
 from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime, date, time
 from enum import Enum
-from typing import get_origin
+from functools import cache
+from operator import attrgetter
+from string import Formatter
+from typing import Callable, ClassVar, get_origin
 
 import dateutil.parser
 
 
+def _attribute(obj: object, path: str) -> object:
+    """Return the value of a dotted attribute path, or None if any part of it is None."""
+    for name in path.split("."):
+        if obj is None:
+            return None
+        obj = getattr(obj, name)
+    return obj
+
+
+def to_columns(rows: list, layout: dict[str, tuple[str, str]]) -> dict:
+    """Return a dict of NumPy arrays, one per column, from a list of dataclasses.
+
+    The layout maps each column name to the dotted attribute path of its value and its
+    NumPy dtype. Missing values become NaN or NaT. This requires the optional numpy dependency."""
+    import numpy
+    return {
+        name: numpy.fromiter((_attribute(row, path) for row in rows), dtype=dtype, count=len(rows))
+        for name, (path, dtype) in layout.items()
+    }
+
+
+@cache
+def _enum_lookup(enum_type: type[Enum]) -> dict:
+    """Return a table mapping the names and values of an Enum to its members.
+    Names take precedence over values as they are the form returned by the API."""
+    lookup = {member.value: member for member in enum_type}
+    lookup.update(enum_type.__members__)
+    return lookup
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse a datetime string, using the fast ISO 8601 parser for the format returned by the API
+    and only falling back to the slower but more lenient dateutil parser for other formats."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return dateutil.parser.parse(value)
+
+
+def _parse_date(value: str) -> date:
+    return _parse_datetime(value).date()
+
+
+def _parse_time(value: str) -> time:
+    try:
+        return time.fromisoformat(value)
+    except ValueError:
+        return dateutil.parser.parse(value).time()
+
+
+# Functions used to convert strings into the date and time field types
+_PARSERS = {date: _parse_date, time: _parse_time, datetime: _parse_datetime}
+
+
+def _convert_dict(entry_type: object, entry_value: dict) -> dict:
+    """Convert the values and, where the index is an Enum, the keys of a dict field."""
+    # Create a new dict in case we have to change the index
+    new_dict = {}
+    for data in entry_value:
+        # if the dict value is a dataclass
+        if is_dataclass(entry_type.__args__[1]):
+            entry_value[data] = entry_type.__args__[1](**(entry_value[data]))
+        # if the dict index is an enum
+        if issubclass(entry_type.__args__[0], Enum):
+            new_dict[_enum_lookup(entry_type.__args__[0])[data]] = entry_value[data]
+        else:
+            new_dict[data] = entry_value[data]
+    return new_dict
+
+
+def _is_enum(entry_type: object) -> bool:
+    return isinstance(entry_type, type) and issubclass(entry_type, Enum)
+
+
+@cache
+def _converter(cls: type) -> Callable[[object], None]:
+    """Generate the function which converts the fields of a dataclass after initialisation.
+
+    The function is built from source once per class, with one block per field that needs
+    converting and the converter for the field's type bound in, so instances do not
+    re-examine their field types. Fields with a primitive type are omitted."""
+    namespace = {"intern": sys.intern}
+    lines = ["def convert(self):"]
+    for name in sorted(cls._intern_fields):
+        lines += [f"    if isinstance(self.{name}, str):",
+                  f"        self.{name} = intern(self.{name})"]
+    for index, entry in enumerate(fields(cls)):
+        name, entry_type, ref = entry.name, entry.type, f"type_{index}"
+        if entry_type in (str, int, float, bool) or issubclass(entry_type.__class__, range):
+            continue
+        namespace[ref] = entry_type
+        # If the entry type is an Enum then convert it to an Enum entry using the lookup table
+        if _is_enum(entry_type):
+            namespace[f"lookup_{index}"] = _enum_lookup(entry_type)
+            lines += ["    try:",
+                      f"        self.{name} = lookup_{index}[self.{name}]",
+                      "    except KeyError:",
+                      f"        self.{name} = {ref}(self.{name})",
+                      "    except TypeError:",
+                      "        pass"]
+        # If the entry type is a date, time or datetime then convert it from a string
+        elif entry_type in _PARSERS:
+            namespace[f"parse_{index}"] = _PARSERS[entry_type]
+            lines += [f"    if self.{name} is not None:",
+                      f"        self.{name} = parse_{index}(self.{name})"]
+        # If the entry type is a list of dataclasses then parse each entry of the list into the dataclass
+        # using its from_dict classmethod where one is provided to handle renamed keys
+        elif get_origin(entry_type) == list and is_dataclass(entry_type.__args__[0]):
+            item_type = entry_type.__args__[0]
+            namespace[f"item_{index}"] = item_type
+            build = f"item_{index}.from_dict(data)" if hasattr(item_type, "from_dict") else f"item_{index}(**data)"
+            lines += [f"    entries = self.{name}",
+                      "    for index, data in enumerate(entries):",
+                      f"        entries[index] = {build}"]
+        # If the entry type is a list of Enums then convert each entry to an Enum entry
+        elif get_origin(entry_type) == list and _is_enum(entry_type.__args__[0]):
+            namespace[f"item_{index}"] = entry_type.__args__[0]
+            namespace[f"lookup_{index}"] = _enum_lookup(entry_type.__args__[0])
+            lines += [f"    entries = self.{name}",
+                      "    for index, data in enumerate(entries):",
+                      "        try:",
+                      f"            entries[index] = lookup_{index}[data]",
+                      "        except KeyError:",
+                      f"            entries[index] = item_{index}(data)",
+                      "        except TypeError:",
+                      "            pass"]
+        # If the entry type is a dataclass and the entry is not null then parse the entry into the dataclass
+        elif is_dataclass(entry_type):
+            lines += [f"    if self.{name}:",
+                      f"        self.{name} = {ref}(**self.{name})"]
+        # If the entry type is a dict and the entry is not null then convert its keys and values
+        elif get_origin(entry_type) == dict:
+            namespace["convert_dict"] = _convert_dict
+            lines += [f"    if self.{name}:",
+                      f"        self.{name} = convert_dict({ref}, self.{name})"]
+    lines.append("    return None")
+    exec(compile("\n".join(lines), f"<{cls.__qualname__} converter>", "exec"), namespace)
+    return namespace["convert"]
+
+
 @dataclass
 class baseclass:
     """This dataclass provides the post_init code to handle the nested dataclasses
-    and formatting of datetime entries"""
+    and formatting of datetime entries
 
+    The conversion is performed by a function generated once for each subclass.
+    Subclasses may list low cardinality string fields in _intern_fields, such as
+    manufacturer or model, so that repeated values share a single interned string."""
+    # Empty slots so that subclasses declared with slots=True carry no instance __dict__
+    __slots__ = ()
+    _intern_fields: ClassVar[frozenset] = frozenset()
 
     def __post_init__(self) -> None:
-        for entry in fields(self):
-            entry_value = getattr(self, entry.name)            
-            if entry.type in (str, int, float, bool):
-                pass
-            elif issubclass(entry.type.__class__, range):
-                pass
-            # If the entry type is date then convert it from a string to a date object
-            elif entry.type == date and entry_value is not None:
-                setattr(self, entry.name, dateutil.parser.parse(entry_value).date())
-            # If the entry type is time then convert it from a string to a time object
-            elif entry.type == time and entry_value is not None:
-                setattr(self, entry.name, dateutil.parser.parse(entry_value).time())                
-            # If the entry type is datetime then convert it from a string to a datetime object
-            elif entry.type == datetime and entry_value is not None:
-                setattr(self, entry.name, dateutil.parser.parse(entry_value))
-            # If the entry type is a list
-            elif get_origin(entry.type) == list:
-                # If the type of the list entry is a dataclass then parse each entry of the list into the dataclass
-                if is_dataclass(entry.type.__args__[0]):
-                    for index, data in enumerate(entry_value):
-                        entry_value[index] = entry.type.__args__[0](**(entry_value[index]))
-                # If the type of the list entry is an Enum then convert it to an Enum entry
-                if issubclass(entry.type.__args__[0], Enum):
-                    try:
-                        entry_value[index] = entry.type.__args__[0][data]
-                    except KeyError:
-                        setattr(self, entry.name, entry.type(entry_value))
-                    except TypeError:
-                        pass
-            # If the entry type is a dataclass and the entry is not null then parse the entry into the dataclass
-            elif (is_dataclass(entry.type)) and (bool(entry_value)):
-                setattr(self, entry.name, entry.type(**(entry_value)))
-            # If the entry type is an Enum then convert it to an Enum entry
-            elif issubclass(entry.type, Enum):
-                try:
-                    setattr(self, entry.name, entry.type[entry_value])
-                except KeyError:
-                    setattr(self, entry.name, entry.type(entry_value))
-                except TypeError:
-                    pass
-            # If the entry type is a dict and the entry is not null
-            elif (get_origin(entry.type) == dict) and (bool(entry_value)):
-                # Create a new dict in case we have to change the index
-                new_dict = {}
-                for index, data in enumerate(entry_value):
-                    # if the dict value is a dataclass
-                    if is_dataclass(entry.type.__args__[1]):
-                        entry_value[data] = entry.type.__args__[1](**(entry_value[data]))
-                    # if the dict index is an enum
-                    if issubclass(entry.type.__args__[0], Enum):
-                        # print(getattr(entry.type.__args__[0], data))
-                        new_dict[getattr(entry.type.__args__[0], data)] = entry_value[data]
-                        # for index, data in enumerate(entry_value):
-                        #    entry_value[index] = entry.type.__args__[0][entry.name]
-                    else:
-                        new_dict[data] = entry_value[data]
-                setattr(self, entry.name, new_dict)
-
-
-@dataclass(frozen=True)
+        _converter(self.__class__)(self)
+
+
+def _parse(entry_type: object, value: object) -> object:
+    """Parse a decoded JSON value into the given dataclass, or list of dataclasses.
+    Null or empty values are returned unchanged, as they are for nested dataclass fields."""
+    if not value:
+        return value
+    if is_dataclass(entry_type):
+        from_dict = getattr(entry_type, "from_dict", None)
+        return from_dict(value) if from_dict is not None else entry_type(**value)
+    if get_origin(entry_type) == list and is_dataclass(entry_type.__args__[0]):
+        return [_parse(entry_type.__args__[0], data) for data in value]
+    return value
+
+
+def _tuple_getter(names: tuple) -> Callable[[object], tuple]:
+    """Return a callable that fetches the named attributes of an object as a tuple."""
+    if not names:
+        return lambda obj: ()
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    return attrgetter(*names)
+
+
+def _path_builder(endpoint: str, names: tuple) -> Callable[[tuple], str]:
+    """Return a callable that substitutes argument values, in the order of names, into an endpoint template.
+    The template is split once into its literal parts so that no template is parsed per call.
+    Templates with placeholders that are not arguments fall back to str.format."""
+    parts = list(Formatter().parse(endpoint))
+    placeholders = [name for _, name, _, _ in parts if name is not None]
+    if any(name not in names for name in placeholders):
+        return lambda values: endpoint.format(**dict(zip(names, values)))
+    literals = [literal for literal, _, _, _ in parts]
+    indices = [names.index(name) for name in placeholders]
+    if not indices:
+        return lambda values: endpoint
+    # Most endpoints have a single site ID placeholder so it is handled by simple concatenation
+    if len(indices) == 1:
+        prefix, suffix, index = literals[0], "".join(literals[1:]), indices[0]
+        return lambda values: f"{prefix}{values[index]}{suffix}"
+    trailer = "".join(literals[len(indices):])
+
+    def build(values: tuple) -> str:
+        return "".join(f"{literal}{values[index]}" for literal, index in zip(literals, indices)) + trailer
+    return build
+
+
+@dataclass(frozen=True, slots=True)
 class Endpoint:
-    """Dataclass describing API endpoints and the data they return."""
-    response: object
+    """Dataclass describing API endpoints and the data they return.
+
+    The argument and parameter names are resolved once at construction, together with
+    getters for their values and a builder for the endpoint path, so that building a
+    request does not need to dereference the Enum values, build dicts or parse templates.
+
+    Where the response dataclass is a single field envelope declaring an _unwrap_key,
+    the response is parsed directly into the type of that field."""
+    response: type
     sample: str = None
     name: str = None
     endpoint: str = ""
     type: str = "get"
     auth: str = None
-    arguments: list = field(default_factory=list)
-    parms: list = field(default_factory=list)
+    arguments: tuple = ()
+    parms: tuple = ()
+    _arg_names: tuple = field(init=False, repr=False, compare=False)
+    _parm_names: tuple = field(init=False, repr=False, compare=False)
+    _arg_values: Callable = field(init=False, repr=False, compare=False)
+    _parm_values: Callable = field(init=False, repr=False, compare=False)
+    _path: Callable = field(init=False, repr=False, compare=False)
+    _unwrap_key: str = field(init=False, repr=False, compare=False)
+    _unwrap_type: object = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The dataclass is frozen so the derived attributes are set via object.__setattr__
+        object.__setattr__(self, "arguments", tuple(self.arguments))
+        object.__setattr__(self, "parms", tuple(self.parms))
+        object.__setattr__(self, "_arg_names", tuple(entry.value for entry in self.arguments))
+        object.__setattr__(self, "_parm_names", tuple(entry.value for entry in self.parms))
+        object.__setattr__(self, "_arg_values", _tuple_getter(self._arg_names))
+        object.__setattr__(self, "_parm_values", _tuple_getter(self._parm_names))
+        object.__setattr__(self, "_path", _path_builder(self.endpoint, self._arg_names))
+        # Resolve the type of the enveloped field for responses which are unwrapped
+        unwrap_key = getattr(self.response, "_unwrap_key", None)
+        unwrap_type = None
+        if unwrap_key is not None:
+            unwrap_type = next(entry.type for entry in fields(self.response) if entry.name == unwrap_key)
+        object.__setattr__(self, "_unwrap_key", unwrap_key)
+        object.__setattr__(self, "_unwrap_type", unwrap_type)
+
+    def path(self, arguments: "APIArguments") -> str:
+        """Return the endpoint path with the arguments substituted."""
+        return self._path(self._arg_values(arguments))
+
+    def parse(self, body: dict) -> object:
+        """Parse the decoded JSON body of a response, skipping the envelope where possible."""
+        if self._unwrap_key is None:
+            return self.response(**body)
+        return _parse(self._unwrap_type, body[self._unwrap_key])
+
+    def params(self, parameters: "APIParameters") -> dict:
+        """Return the query parameters for the endpoint which have been set."""
+        return {
+            name: value
+            for name, value in zip(self._parm_names, self._parm_values(parameters))
+            if value is not None
+        }
 
 
 @dataclass
@@ -108,14 +297,14 @@ class RESTClient:
     Attributes:
         url: The URL used for the REST API
         auth: The type of authorisation used
-        apis: A list of the API Endpoints
-        apiargs: A dataclass describing the set of arguments used by the endpoints
-        apiparms: A dataclass describing the set of parameters used by the endpoints
-        constants: A list of constants
+        apilist: A dict of the API Endpoints keyed by name
+        arguments: A dataclass describing the set of arguments used by the endpoints
+        parameters: A dataclass describing the set of parameters used by the endpoints
+        constants: A dict of constants keyed by name
     """
     url: str
     auth: str
-    apilist: Enum
+    apilist: dict
     arguments: APIArguments = None
     parameters: APIParameters = None
-    constants: Enum = None
+    constants: dict = None
@@ -17,14 +17,16 @@ APIArguments and APIParameters: The APIArguments and APIParameters data classes
 parameters required for making API requests. These classes have default values and can be customized as needed.
 
 The Solaredge instance of the RESTClient is configured to interact with the SolarEdge API.
+It is created on first access rather than at import.
 """
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, date
 from enum import Enum
-from typing import List
+from operator import attrgetter
+from types import SimpleNamespace
+from typing import ClassVar
 
-from dataclasses_json import config, dataclass_json
-from solaredge.apiconstruct import baseclass, RESTClient, Endpoint
+from solaredge.apiconstruct import baseclass, RESTClient, Endpoint, to_columns
 
 
 class TimeUnit(Enum):
@@ -148,31 +150,53 @@ class APIParms(Enum):
     SYSTEM_UNITS = "systemUnits"
 
 
+def _default_dates() -> tuple[str, str, str, str]:
+    """Return the default start/end dates and times derived from a single timestamp."""
+    now = datetime.now(tz=None)
+    yesterday = now - timedelta(days=1)
+    return (yesterday.strftime('%Y-%m-%d'), now.strftime('%Y-%m-%d'),
+            yesterday.strftime('%Y-%m-%d %H:%M:%S'), now.strftime('%Y-%m-%d %H:%M:%S'))
+
+
+# Raw wire values used as parameter defaults, the Enums remain available for validation
+_ORDER_ASC = "ASC"
+_STATUS_ALL = "All"
+_TIMEUNIT_HOUR = "HOUR"
+_METRICS = "Metric"
+
+
 @dataclass
 class APIParameters:
-    """Dataclass describing the set of parameters used by the API endpoints."""
+    """Dataclass describing the set of parameters used by the API endpoints.
+    Unless provided, the start and end dates and times default to yesterday and now,
+    evaluated from a single timestamp when the instance is created."""
     size: int = 100
     startIndex: int = 0
     searchText: str = None
     sortProperty: Property = None
-    sortOrder: Order = Order.ASCENDING.value
-    Status: SiteStatus = SiteStatus.ALL.value
+    sortOrder: Order = _ORDER_ASC
+    Status: SiteStatus = _STATUS_ALL
     api_key: str = None
-    startDate: str = (datetime.now(tz=None) -
-                      timedelta(days=1)).strftime('%Y-%m-%d')
-    endDate: str = (datetime.now(tz=None)).strftime('%Y-%m-%d')
-    startTime: str = (datetime.now(tz=None)-timedelta(days=1)
-                      ).strftime('%Y-%m-%d %H:%M:%S')
-    endTime: str = datetime.now(tz=None).strftime('%Y-%m-%d %H:%M:%S')
-    timeUnit: TimeUnit = TimeUnit.HOUR.value
+    startDate: str = None
+    endDate: str = None
+    startTime: str = None
+    endTime: str = None
+    timeUnit: TimeUnit = _TIMEUNIT_HOUR
     meters: Meters = None
     serials: str = None
-    systemUnits: Metrics = Metrics.METRIC.value
+    systemUnits: Metrics = _METRICS
+
+    def __post_init__(self) -> None:
+        defaults = _default_dates()
+        for name, default in zip(("startDate", "endDate", "startTime", "endTime"), defaults):
+            if getattr(self, name) is None:
+                setattr(self, name, default)
 
 
 @dataclass
 class Location(baseclass):
     """This dataclass describes the location information provided in multiple API endpoints"""
+    _intern_fields: ClassVar[frozenset] = frozenset({"timeZone", "countryCode"})
     country: str
     city: str
     address: str
@@ -245,13 +269,14 @@ class SiteList(baseclass):
 @dataclass
 class SitesResponse(baseclass):
     """This dataclass describes the response from the Sites API endpoint"""
+    _unwrap_key: ClassVar[str] = "sites"
     sites: SiteList
 
 
 Sites = Endpoint(endpoint="sites/list",
                  name="Site List",
-                 parms=[APIParms.API_KEY, APIParms.SIZE, APIParms.START_INDEX, APIParms.SEARCH_TEXT,
-                        APIParms.SORT_PROPERTY, APIParms.SORT_ORDER, APIParms.STATUS],
+                 parms=(APIParms.API_KEY, APIParms.SIZE, APIParms.START_INDEX, APIParms.SEARCH_TEXT,
+                        APIParms.SORT_PROPERTY, APIParms.SORT_ORDER, APIParms.STATUS),
                  sample="site_list.json",
                  response=SitesResponse)
 
@@ -259,13 +284,14 @@ Sites = Endpoint(endpoint="sites/list",
 @dataclass
 class SiteInfoResponse(baseclass):
     """This dataclass describes the response from the SiteInfo API endpoint"""
+    _unwrap_key: ClassVar[str] = "details"
     details: Site
 
 
 SiteInfo = Endpoint(endpoint="site/{siteid}/details",
                     name="Site Details",
-                    arguments=[APIArgs.SITEID],
-                    parms=[APIParms.API_KEY],
+                    arguments=(APIArgs.SITEID,),
+                    parms=(APIParms.API_KEY,),
                     response=SiteInfoResponse)
 
 
@@ -286,19 +312,20 @@ class EnvBenefits(baseclass):
 
 @dataclass
 class EnvBenefitsResponse(baseclass):
+    _unwrap_key: ClassVar[str] = "envBenefits"
     envBenefits: EnvBenefits
 
 
 SiteBenefits = Endpoint(endpoint="site/{siteid}/envBenefits",
                         name="Site Environmental Benefits",
-                        arguments=[APIArgs.SITEID],
-                        parms=[APIParms.API_KEY],
+                        arguments=(APIArgs.SITEID,),
+                        parms=(APIParms.API_KEY,),
                         response=EnvBenefitsResponse)
 
 SiteImage = Endpoint(endpoint="site/{siteid}/siteimage/{name}",
                      name="Site Image",
-                     arguments=[APIArgs.SITEID],
-                     parms=[APIParms.API_KEY],
+                     arguments=(APIArgs.SITEID,),
+                     parms=(APIParms.API_KEY,),
                      response=str)
 
 
@@ -326,13 +353,14 @@ class OverviewData(baseclass):
 
 @dataclass
 class OverviewResponse(baseclass):
+    _unwrap_key: ClassVar[str] = "overview"
     overview: OverviewData
 
 
 SiteOverview = Endpoint(endpoint="site/{siteid}/overview",
                         name="Site Overview",
-                        arguments=[APIArgs.SITEID],
-                        parms=[APIParms.API_KEY],
+                        arguments=(APIArgs.SITEID,),
+                        parms=(APIParms.API_KEY,),
                         response=OverviewResponse)
 
 
@@ -344,23 +372,32 @@ class DataPeriod(baseclass):
 
 @dataclass
 class SiteDataPeriodResponse(baseclass):
+    _unwrap_key: ClassVar[str] = "dataPeriod"
     dataPeriod: DataPeriod
 
 
 SiteDataPeriod = Endpoint(endpoint="site/{siteid}/dataPeriod",
                           name="Site Data: Start and End Dates",
-                          arguments=[APIArgs.SITEID],
-                          parms=[APIParms.API_KEY],
+                          arguments=(APIArgs.SITEID,),
+                          parms=(APIParms.API_KEY,),
                           response=SiteDataPeriodResponse)
 
 
-@dataclass
+# Column layout used by the columns methods for lists of values
+VALUE_COLUMNS = {
+    "date": ("date", "datetime64[s]"),
+    "value": ("value", "f8"),
+}
+
+
+@dataclass(slots=True)
 class Value(baseclass):
     date: datetime
     value: float = float(0)
 
     def __post_init__(self):
-        super().__post_init__()
+        # Zero argument super() is not usable in a slotted dataclass
+        baseclass.__post_init__(self)
         if self.value is None:
             self.value = float(0)
 
@@ -370,25 +407,31 @@ class EnergyData(baseclass):
     timeUnit: TimeUnit
     unit: str
     measuredBy: str
-    values: List[Value]
+    values: list[Value]
+
+    def columns(self) -> dict:
+        """Return the values as NumPy arrays keyed by VALUE_COLUMNS. Requires numpy."""
+        return to_columns(self.values, VALUE_COLUMNS)
 
 
 @dataclass
 class EnergyDataResponse(baseclass):
+    _unwrap_key: ClassVar[str] = "energy"
     energy: EnergyData
 
 
 SiteEnergy = Endpoint(endpoint="site/{siteid}/energy",
                       name="Site Energy",
-                      arguments=[APIArgs.SITEID],
-                      parms=[APIParms.API_KEY, APIParms.START_DATE,
-                             APIParms.END_DATE, APIParms.TIME_UNIT],
+                      arguments=(APIArgs.SITEID,),
+                      parms=(APIParms.API_KEY, APIParms.START_DATE,
+                             APIParms.END_DATE, APIParms.TIME_UNIT),
                       sample="site_energy.json",
                       response=EnergyDataResponse)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnergyValue(baseclass):
+    _intern_fields: ClassVar[frozenset] = frozenset({"unit"})
     date: datetime
     energy: float
     unit: str
@@ -405,21 +448,22 @@ class TimeFrameEnergyData(baseclass):
 
 @dataclass
 class TimeFrameEnergyResponse(baseclass):
+    _unwrap_key: ClassVar[str] = "timeFrameEnergy"
     timeFrameEnergy: TimeFrameEnergyData
 
 
 SiteEnergyTimeframe = Endpoint(endpoint="site/{siteid}/timeFrameEnergy",
                                name="Site Energy - Time Period",
-                               arguments=[APIArgs.SITEID],
-                               parms=[APIParms.API_KEY,
-                                      APIParms.START_DATE, APIParms.END_DATE],
+                               arguments=(APIArgs.SITEID,),
+                               parms=(APIParms.API_KEY,
+                                      APIParms.START_DATE, APIParms.END_DATE),
                                response=TimeFrameEnergyResponse)
 
 
 @dataclass
 class DataType(baseclass):
     type: str
-    values: List[Value]
+    values: list[Value]
 
 
 @dataclass
@@ -433,33 +477,35 @@ class DetailData(baseclass):
         """
     timeUnit: TimeUnit
     unit: str
-    meters: List[DataType]
+    meters: list[DataType]
 
 
 @dataclass
 class EnergyDetailResponse(baseclass):
+    _unwrap_key: ClassVar[str] = "energyDetails"
     energyDetails: DetailData
 
 
 EnergyDetails = Endpoint(endpoint="site/{siteid}/energyDetails",
                          name="Site Energy - Details",
-                         arguments=[APIArgs.SITEID],
-                         parms=[APIParms.API_KEY, APIParms.START_TIME, APIParms.END_TIME,
-                                APIParms.TIME_UNIT, APIParms.METERS],
+                         arguments=(APIArgs.SITEID,),
+                         parms=(APIParms.API_KEY, APIParms.START_TIME, APIParms.END_TIME,
+                                APIParms.TIME_UNIT, APIParms.METERS),
                          response=EnergyDetailResponse)
 
 
 @dataclass
 class PowerDetailsResponse(baseclass):
     """This dataclass describes the response from the Power Details API endpoint"""
+    _unwrap_key: ClassVar[str] = "powerDetails"
     powerDetails: DetailData
 
 
 PowerDetails = Endpoint(endpoint="site/{siteid}/powerDetails",
                         name="Site Power - Details",
-                        arguments=[APIArgs.SITEID],
-                        parms=[APIParms.API_KEY, APIParms.START_TIME,
-                               APIParms.END_TIME, APIParms.METERS],
+                        arguments=(APIArgs.SITEID,),
+                        parms=(APIParms.API_KEY, APIParms.START_TIME,
+                               APIParms.END_TIME, APIParms.METERS),
                         response=PowerDetailsResponse)
 
 
@@ -468,29 +514,38 @@ class PowerData(baseclass):
     timeUnit: TimeUnit
     unit: str
     measuredBy: str
-    values: List[Value]
+    values: list[Value]
+
+    def columns(self) -> dict:
+        """Return the values as NumPy arrays keyed by VALUE_COLUMNS. Requires numpy."""
+        return to_columns(self.values, VALUE_COLUMNS)
 
 
 @dataclass
 class PowerDataResponse(baseclass):
+    _unwrap_key: ClassVar[str] = "power"
     power: PowerData
 
 
 Power = Endpoint(endpoint="site/{siteid}/power",
                  name="Site Power",
-                 arguments=[APIArgs.SITEID],
-                 parms=[APIParms.API_KEY, APIParms.START_TIME, APIParms.END_TIME],
+                 arguments=(APIArgs.SITEID,),
+                 parms=(APIParms.API_KEY, APIParms.START_TIME, APIParms.END_TIME),
                  response=PowerDataResponse)
 
 
-@dataclass_json
-@dataclass
+@dataclass(slots=True)
 class Connection:
-    from_: str = field(metadata=config(field_name="from"))
-    to_: str = field(metadata=config(field_name="to"))
+    """This dataclass describes a power flow connection, renaming the reserved word "from"."""
+    from_: str
+    to_: str
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Connection":
+        return cls(from_=data["from"], to_=data["to"])
 
-@dataclass
+
+@dataclass(slots=True)
 class PowerDetailInfo(baseclass):
     status: str
     currentPower: float
@@ -501,7 +556,7 @@ class PowerDetailInfo(baseclass):
 @dataclass
 class SiteCurrentPowerFlow(baseclass):
     unit: str
-    connections: List[Connection]
+    connections: list[Connection]
     GRID: PowerDetailInfo
     LOAD: PowerDetailInfo
     PV: PowerDetailInfo
@@ -510,17 +565,18 @@ class SiteCurrentPowerFlow(baseclass):
 
 @dataclass
 class PowerFlowResponse(baseclass):
+    _unwrap_key: ClassVar[str] = "siteCurrentPowerFlow"
     siteCurrentPowerFlow: SiteCurrentPowerFlow
 
 
 PowerFlow = Endpoint(endpoint="site/{siteid}/currentPowerFlow",
                      name="Site Power Flow",
-                     arguments=[APIArgs.SITEID],
-                     parms=[APIParms.API_KEY],
+                     arguments=(APIArgs.SITEID,),
+                     parms=(APIParms.API_KEY,),
                      response=PowerFlowResponse)
 
 
-@dataclass
+@dataclass(slots=True)
 class BatteryTelemetry(baseclass):
     timeStamp: str
     power: int
@@ -532,36 +588,59 @@ class BatteryTelemetry(baseclass):
     ACGridCharging: int
 
 
+# Column layout of the NumPy structured array returned by Battery.telemetry_array
+# Numeric columns are floats so that missing values are represented as NaN
+_BATTERY_TELEMETRY_DTYPE = [
+    ("timeStamp", "datetime64[s]"),
+    ("power", "f8"),
+    ("batteryState", "f8"),
+    ("lifeTimeEnergyCharged", "f8"),
+    ("lifeTimeEnergyDischarged", "f8"),
+    ("fullPackEnergyAvailable", "f8"),
+    ("internalTemp", "f8"),
+    ("ACGridCharging", "f8"),
+]
+
+
 @dataclass
 class Battery(baseclass):
     nameplate: int
     serialNumber: str
     modelNumber: str
     telemetryCount: int
-    telemetries: List[BatteryTelemetry]
+    telemetries: list[BatteryTelemetry]
+
+    def telemetry_array(self):
+        """Return the telemetries as a NumPy structured array with one row per entry.
+        This requires the optional numpy dependency to be installed."""
+        import numpy
+        row = attrgetter(*(name for name, _ in _BATTERY_TELEMETRY_DTYPE))
+        return numpy.array([row(entry) for entry in self.telemetries], dtype=_BATTERY_TELEMETRY_DTYPE)
 
 
 @dataclass
 class StorageData(baseclass):
     batteryCount: int
-    batteries: List[Battery]
+    batteries: list[Battery]
 
 
 @dataclass
 class StorageDataResponse(baseclass):
+    _unwrap_key: ClassVar[str] = "storageData"
     storageData: StorageData
 
 
 Storage = Endpoint(endpoint="site/{siteid}/storageData",
                    name="Battery Telemetry",
-                   arguments=[APIArgs.SITEID],
-                   parms=[APIParms.API_KEY, APIParms.START_TIME,
-                          APIParms.END_TIME, APIParms.SERIALS],
+                   arguments=(APIArgs.SITEID,),
+                   parms=(APIParms.API_KEY, APIParms.START_TIME,
+                          APIParms.END_TIME, APIParms.SERIALS),
                    response=StorageDataResponse)
 
 
 @dataclass
 class Meter(baseclass):
+    _intern_fields: ClassVar[frozenset] = frozenset({"manufacturer", "model"})
     name: str
     manufacturer: str
     model: str
@@ -589,6 +668,7 @@ class Gateway(baseclass):
 @dataclass
 class BatteryInventory(baseclass):
     """This dataclass describes the battery information provided by the Inventory API Endpoint"""
+    _intern_fields: ClassVar[frozenset] = frozenset({"manufacturer", "model"})
     name: str
     manufacturer: str
     model: str
@@ -606,6 +686,7 @@ class Inverter(baseclass):
         SN: The serial number of the inverter which is used in other API requests
 
         name, manufacturer, model, communicationMethod, cpuVersion, connectedOptimizers"""
+    _intern_fields: ClassVar[frozenset] = frozenset({"manufacturer", "model"})
     SN: str
     name: str
     manufacturer: str
@@ -638,19 +719,21 @@ class InventoryData(baseclass):
 @dataclass
 class InventoryResponse(baseclass):
     """This dataclass describes the response from the Inventory API endpoint"""
+    _unwrap_key: ClassVar[str] = "Inventory"
     Inventory: InventoryData
 
 
 Inventory = Endpoint(endpoint="site/{siteid}/inventory",
                      name="Site Inventory",
-                     arguments=[APIArgs.SITEID],
-                     parms=[APIParms.API_KEY],
+                     arguments=(APIArgs.SITEID,),
+                     parms=(APIParms.API_KEY,),
                      response=InventoryResponse)
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentEntry(baseclass):
     """This dataclass describes the component data provided by the Components API Endpoint"""
+    _intern_fields: ClassVar[frozenset] = frozenset({"manufacturer", "model"})
     name: str
     manufacturer: str
     model: str
@@ -669,17 +752,18 @@ class ComponentList(baseclass):
 @dataclass
 class ComponentsResponse(baseclass):
     """This dataclass describes the response from the Components API endpoint"""
+    _unwrap_key: ClassVar[str] = "reporters"
     reporters: ComponentList
 
 
 Components = Endpoint(endpoint="equipment/{siteid}/list",
                       name="Site Components",
-                      arguments=[APIArgs.SITEID],
-                      parms=[APIParms.API_KEY],
+                      arguments=(APIArgs.SITEID,),
+                      parms=(APIParms.API_KEY,),
                       response=ComponentsResponse)
 
 
-@dataclass
+@dataclass(slots=True)
 class LData(baseclass):
     """This dataclass describes the phase information as part of the inverter telemetry."""
     acCurrent: float
@@ -691,7 +775,7 @@ class LData(baseclass):
     cosPhi: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Telemetry(baseclass):
     """This dataclass describes the telemetry information provided for the inverter."""
     date: datetime
@@ -711,23 +795,44 @@ class Telemetry(baseclass):
     L3Data: LData = None
 
 
+# Column layout returned by telemetry_columns, the phase data is for L1 as used by single phase inverters
+TELEMETRY_COLUMNS = {
+    "date": ("date", "datetime64[s]"),
+    "totalActivePower": ("totalActivePower", "f8"),
+    "powerLimit": ("powerLimit", "f8"),
+    "totalEnergy": ("totalEnergy", "f8"),
+    "temperature": ("temperature", "f8"),
+    "dcVoltage": ("dcVoltage", "f8"),
+    "acCurrent": ("L1Data.acCurrent", "f8"),
+    "acVoltage": ("L1Data.acVoltage", "f8"),
+    "acFrequency": ("L1Data.acFrequency", "f8"),
+    "activePower": ("L1Data.activePower", "f8"),
+}
+
+
+def telemetry_columns(telemetries: list[Telemetry]) -> dict:
+    """Return inverter telemetry as NumPy arrays keyed by TELEMETRY_COLUMNS. Requires numpy."""
+    return to_columns(telemetries, TELEMETRY_COLUMNS)
+
+
 @dataclass
 class InverterInfo(baseclass):
     """This dataclass describes the information provided by the InverterTelemetry API Endpoint"""
     count: int
-    telemetries: List[Telemetry]
+    telemetries: list[Telemetry]
 
 
 @dataclass
 class InverterResponse(baseclass):
     """This dataclass describes the response from the InverterTelemetry API endpoint"""
+    _unwrap_key: ClassVar[str] = "data"
     data: InverterInfo
 
 
 InverterTelemetry = Endpoint(endpoint="equipment/{siteid}/{serialnumber}/data",
                              name="Inverter Technical Data",
-                             arguments=[APIArgs.SITEID, APIArgs.SERIALNUMBER],
-                             parms=[APIParms.API_KEY, APIParms.START_TIME, APIParms.END_TIME],
+                             arguments=(APIArgs.SITEID, APIArgs.SERIALNUMBER),
+                             parms=(APIParms.API_KEY, APIParms.START_TIME, APIParms.END_TIME),
                              response=InverterResponse)
 
 
@@ -738,81 +843,95 @@ class Version(baseclass):
 
 @dataclass
 class VersionResponse(baseclass):
+    _unwrap_key: ClassVar[str] = "version"
     version: Version
 
 
 CurrentVersion = Endpoint(endpoint="version/current",
                           name="Current Version",
-                          parms=[APIParms.API_KEY],
+                          parms=(APIParms.API_KEY,),
                           response=VersionResponse)
 
 
 @dataclass
 class VersionsResponse(baseclass):
-    supported: List[Version]
+    _unwrap_key: ClassVar[str] = "supported"
+    supported: list[Version]
 
 
 SupportedVersions = Endpoint(endpoint="version/supported",
                              name="Supported Vesions",
-                             parms=[APIParms.API_KEY],
+                             parms=(APIParms.API_KEY,),
                              response=VersionsResponse)
 
 
-class ConstantList(Enum):
-    """This enum lists all the defined constant, making it easy to reference them.
-    The Enum value is the instance of the constant.
-    """
-    TimeUnit = TimeUnit
-    Unit = Unit
-    Order = Order
-    SiteStatus = SiteStatus
-    Property = Property
-    Meters = Meters
-    Metrics = Metrics
-    InverterMode = InverterMode
-    OperationMode = OperationMode
-    Endpoint = Endpoint
-    DateFormat = "%Y-%m-%d"
-
-
-class APIList(Enum):
-    """This enum lists all the defined API endpoints, making it easy to reference them.
-    The Enum value is the instance of the Endpoint class that describes the endpoint.
-    """
-    Sites = Sites
-    SiteInfo = SiteInfo
-    SiteBenefits = SiteBenefits
-    SiteImage = SiteImage
-    SiteOverview = SiteOverview
-    SiteDataPeriod = SiteDataPeriod
-    SiteEnergy = SiteEnergy
-    SiteEnergyTimeframe = SiteEnergyTimeframe
-    EnergyDetails = EnergyDetails
-    Power = Power
-    PowerDetails = PowerDetails
-    PowerFlow = PowerFlow
-    Storage = Storage
-    Inventory = Inventory
-    Components = Components
-    InverterData = InverterTelemetry
-    CurrentVersion = CurrentVersion
-    SupportedVersions = SupportedVersions
+# This dict lists all the defined constants, making it easy to reference them by name
+CONSTANTS: dict[str, object] = {
+    "TimeUnit": TimeUnit,
+    "Unit": Unit,
+    "Order": Order,
+    "SiteStatus": SiteStatus,
+    "Property": Property,
+    "Meters": Meters,
+    "Metrics": Metrics,
+    "InverterMode": InverterMode,
+    "OperationMode": OperationMode,
+    "Endpoint": Endpoint,
+    "DateFormat": "%Y-%m-%d",
+}
+
+# This dict lists all the defined API endpoints, making it easy to reference them by name
+APIS: dict[str, Endpoint] = {
+    "Sites": Sites,
+    "SiteInfo": SiteInfo,
+    "SiteBenefits": SiteBenefits,
+    "SiteImage": SiteImage,
+    "SiteOverview": SiteOverview,
+    "SiteDataPeriod": SiteDataPeriod,
+    "SiteEnergy": SiteEnergy,
+    "SiteEnergyTimeframe": SiteEnergyTimeframe,
+    "EnergyDetails": EnergyDetails,
+    "Power": Power,
+    "PowerDetails": PowerDetails,
+    "PowerFlow": PowerFlow,
+    "Storage": Storage,
+    "Inventory": Inventory,
+    "Components": Components,
+    "InverterData": InverterTelemetry,
+    "CurrentVersion": CurrentVersion,
+    "SupportedVersions": SupportedVersions,
+}
+
+# Namespaces over the dicts retained for backward compatibility, so that for example
+# APIList.SiteEnergy is a plain attribute access returning the Endpoint itself
+ConstantList = SimpleNamespace(**CONSTANTS)
+APIList = SimpleNamespace(**APIS)
 
 
 @dataclass
 class SummaryData:
     """This dataclass is used to store data returned by multiple calls to the REST API."""
+    versions: list[Version] = field(default_factory=list)
     sites: list[Site] = field(default_factory=list)
     inventories: list[InventoryData] = field(default_factory=list)
     components: list[ComponentEntry] = field(default_factory=list)
 
 
-# This instance of RESTClient describes the SolarEdge API
-Solaredge = RESTClient(
-    url="https://monitoringapi.solaredge.com",
-    auth=None,
-    apilist=APIList,
-    arguments=APIArguments(),
-    parameters=APIParameters(),
-    constants=ConstantList
-)
+# The Solaredge RESTClient is only annotated here, it is created by __getattr__ when first accessed
+Solaredge: RESTClient
+
+
+def __getattr__(name: str) -> object:
+    """Create the Solaredge instance of RESTClient, which describes the SolarEdge API, on first access."""
+    if name == "Solaredge":
+        global Solaredge
+        Solaredge = RESTClient(
+            url="https://monitoringapi.solaredge.com",
+            auth=None,
+            apilist=APIS,
+            arguments=APIArguments(),
+            parameters=APIParameters(),
+            constants=CONSTANTS
+        )
+        return Solaredge
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,33 @@
 #!/usr/bin/env python3
 """Inverter telemetry from the Solaredge API."""
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Iterator
+
+from solaredge.api import MAX_REQUESTS, SolaredgeClient
+from utilities import InfluxConnection, get_env, get_logger, influx_epoch, month_label, write_batches
+
+
+# Fetches the telemetry attributes used for each point in a single call
+_telemetry_values = attrgetter("dcVoltage", "temperature", "date", "L1Data")
+
+
+def telemetry_lines(inverter: str, telemetry: list) -> Iterator[str]:
+    """Formats the telemetry for an inverter as influxdb line protocol points with the time in seconds."""
+    prefix = f"inverter_telemetry,inverter_serial={inverter} "
+    for dcvoltage, temperature, timestamp, l1data in map(_telemetry_values, telemetry):
+        yield (
+            f"{prefix}"
+            f"dcvoltage={float(dcvoltage or 0.0)},"
+            f"temperature={float(temperature)},"
+            f"accurrent={float(l1data.acCurrent)},"
+            f"acvoltage={float(l1data.acVoltage)},"
+            f"acfrequency={float(l1data.acFrequency)},"
+            f'month="{month_label(timestamp)}" '
+            f"{influx_epoch(timestamp)}"
+        )
 
-from solaredge.api import SolaredgeClient
-from utilities import InfluxConnection, get_env, get_logger
 
 def main() -> None:
     """Load historical telemetry data into influxdb."""
@@ -20,24 +43,16 @@ def main() -> None:
 
             # Obtain telemetry data and add to influxdb
             logger.info("Adding Solaredge inverter telemetry information to influxdb")
-            influx_data = [
-                {
-                    'measurement': 'inverter_telemetry',
-                    'time': datetime.strftime(data.date, '%Y-%m-%dT%H:%MZ'),
-                    'tags': {'inverter_serial': inverter},
-                    'fields': {
-                        'dcvoltage': float(data.dcVoltage or 0.0),
-                        'temperature': float(data.temperature),
-                        'accurrent': float(data.L1Data.acCurrent),
-                        'acvoltage': float(data.L1Data.acVoltage),
-                        'acfrequency': float(data.L1Data.acFrequency),
-                        'month': data.date.strftime("%b %Y"),
-                    },
-                }
-                for inverter in client.inverter_list                    
-                for data in client.get_inverter_telemetry(inverter)
-            ]
-            connection.write_points(influx_data)
+            # The telemetry for each inverter is requested concurrently as each call waits on the network
+            inverters = client.inverter_list
+            with ThreadPoolExecutor(max_workers=MAX_REQUESTS) as executor:
+                telemetries = executor.map(client.get_inverter_telemetry, inverters)
+                influx_data = (
+                    line
+                    for inverter, telemetry in zip(inverters, telemetries)
+                    for line in telemetry_lines(inverter, telemetry)
+                )
+                write_batches(connection, influx_data, time_precision='s', protocol='line')
 
 
 if __name__ == "__main__":
@@ -1,29 +1,35 @@
 #!/usr/bin/env python3
 """Call the Solaredge API and print the results."""
 
+import argparse
 import pprint
 import logging
-from datetime import datetime  # noqa
 # from cProfile import Profile
 # from pstats import SortKey, Stats
 
 from solaredge.api import SolaredgeClient
 from utilities import get_env, get_logger
 
+# Printer reused for all the results rather than one being created for each call
+PRINTER = pprint.PrettyPrinter(width=120, compact=True)
+
 
 def main() -> None:
     """Call one of the Solaredge Api endpoints and print the formatted results."""
-    logger = get_logger(destination="stdout") # noqa
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--log", choices=("stdout", "syslog"), default="stdout", help="where to send log messages")
+    args = parser.parse_args()
+    logger = get_logger(destination=args.log) # noqa
     env = get_env()
     logger.setLevel(logging.DEBUG)
     with SolaredgeClient(apikey=env.get('solaredge_apikey')) as client:
         help(client)
-        pprint.pprint(client.get_supported_versions())
+        PRINTER.pprint(client.get_supported_versions())
         for site in client.get_sites():
-            pprint.pprint(site)
-        # pprint.pprint(client.get_inverters(site.id))
-        # pprint.pprint(client.get_inverter_telemetry())
-        # pprint.pprint(list(client._api.constants))
+            PRINTER.pprint(site)
+        # PRINTER.pprint(client.get_inverters(site.id))
+        # PRINTER.pprint(client.get_inverter_telemetry())
+        # PRINTER.pprint(list(client._api.constants))
 
 
 if __name__ == "__main__":
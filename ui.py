@@ -8,6 +8,8 @@ from tkinter import ttk
 from solaredge.api import SolaredgeClient
 from utilities import get_env, get_logger
 
+# Printer reused for each site rather than one being created for each call
+PRINTER = pprint.PrettyPrinter(width=120, compact=True)
 
 
 def main() -> None:
@@ -16,18 +18,27 @@ def main() -> None:
     env = get_env()
 
     with SolaredgeClient(apikey=env.get('solaredge_apikey')) as client:
-        for site in client.get_sites():
-            
-            root = tkinter.Tk(className="SolarEdge")
-            
-            frm = ttk.Frame(root, padding=10)
-            frm.master.title("Solaredge Title")
-            frm.grid()
-            ttk.Label(frm, text=pprint.pformat(site)).grid(column=0, row=0)
-            ttk.Button(frm, text="Update", command=root.destroy).grid(column=1, row=0)            
-            ttk.Button(frm, text="Quit", command=root.destroy).grid(column=1, row=1)
-            root.mainloop()
-
+        sites = list(client.get_sites())
+
+    root = tkinter.Tk(className="SolarEdge")
+    site_text = tkinter.StringVar(root)
+    current = 0
+
+    def show_next_site() -> None:
+        """Shows the next site, returning to the first after the last"""
+        nonlocal current
+        if sites:
+            site_text.set(PRINTER.pformat(sites[current]))
+            current = (current + 1) % len(sites)
+
+    frm = ttk.Frame(root, padding=10)
+    frm.master.title("Solaredge Title")
+    frm.grid()
+    ttk.Label(frm, textvariable=site_text).grid(column=0, row=0)
+    ttk.Button(frm, text="Update", command=show_next_site).grid(column=1, row=0)
+    ttk.Button(frm, text="Quit", command=root.destroy).grid(column=1, row=1)
+    show_next_site()
+    root.mainloop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
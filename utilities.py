@@ -1,37 +1,95 @@
 #!/usr/bin/env python3
 """Utility functions used in various scripts."""
+import atexit
+import calendar
 import logging
 import logging.handlers
 import os
+import queue
 from contextlib import contextmanager
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable
 
 import influxdb
 from dotenv import dotenv_values
 
+# Number of points sent to influxdb in each write request
+INFLUX_BATCH_SIZE = 5000
+# Format of the month label stored with each point
+MONTH_FORMAT = "%b %Y"
+# Formatter for the records sent to syslog, created once for all syslog handlers
+_SYSLOG_FORMATTER = logging.Formatter(
+    fmt='python[%(process)d]: [%(levelname)s] %(filename)s:%(funcName)s:%(lineno)d \"%(message)s\"')
+
+
+def influx_epoch(timestamp: datetime) -> int:
+    """Returns the timestamp as epoch seconds for influxdb, truncated to the minute and treated as UTC"""
+    return calendar.timegm(timestamp.timetuple()) // 60 * 60
+
+
+@lru_cache(maxsize=None)
+def _month_label(year: int, month: int) -> str:
+    return date(year, month, 1).strftime(MONTH_FORMAT)
+
+
+def month_label(timestamp: datetime) -> str:
+    """Returns the month label for a timestamp, formatting each month only once"""
+    return _month_label(timestamp.year, timestamp.month)
+
+
+@lru_cache(maxsize=None)
+def _log_handler(destination: str) -> logging.Handler:
+    """Returns the handler for a destination, created once so that repeated loggers reuse
+    the same syslog socket and queue listener"""
+    if destination == "syslog":
+        target_handler = logging.handlers.SysLogHandler(facility=logging.handlers.SysLogHandler.LOG_DAEMON,
+                                                        address='/dev/log')
+        target_handler.setFormatter(_SYSLOG_FORMATTER)
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(log_queue, target_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        return logging.handlers.QueueHandler(log_queue)
+    return logging.StreamHandler()
+
 
 def get_logger(destination: str = "stdout"):
-    """Creates a logger instance of the desired type"""
+    """Creates a logger instance of the desired type.
+    Syslog records are queued and sent by a background listener so that logging calls
+    do not wait on the syslog socket, the queue is drained when the process exits."""
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
-    handlers = {
-        "stdout": logging.StreamHandler(),
-        "syslog": logging.handlers.SysLogHandler(facility=logging.handlers.SysLogHandler.LOG_DAEMON, 
-                                                 address='/dev/log')
-    }
-    handler = handlers.get(destination)
-    if destination == "syslog":
-        log_format = 'python[%(process)d]: [%(levelname)s] %(filename)s:%(funcName)s:%(lineno)d \"%(message)s\"'
-        handler.setFormatter(logging.Formatter(fmt=log_format))
-    logger.addHandler(handler)
+    logger.addHandler(_log_handler(destination))
     return logger
 
 
+def write_batches(connection: influxdb.InfluxDBClient, points: Iterable, **kwargs) -> None:
+    """Writes points to influxdb in batches of INFLUX_BATCH_SIZE, consuming the points lazily
+    so that only one batch is held in memory at a time"""
+    points = iter(points)
+    while batch := list(islice(points, INFLUX_BATCH_SIZE)):
+        connection.write_points(batch, **kwargs)
+
+
+@lru_cache(maxsize=1)
 def get_env() -> dict:
-    """Reads environment variables from the users home directory"""
+    """Reads environment variables from the users home directory, the file is only read once"""
     env_path = os.path.expanduser('~/.env')
     return dotenv_values(env_path) if os.path.exists(env_path) else {}
 
 
+@lru_cache(maxsize=None)
+def influx_client(database: str, host: str = 'localhost', port: int = 8086) -> influxdb.InfluxDBClient:
+    """Returns the influxdb client for a database, created once so that its pooled HTTP connections
+    are reused by every connection and closed when the process exits.
+    Each database has its own client as the client holds the database that points are written to."""
+    client = influxdb.InfluxDBClient(host=host, port=port, database=database, pool_size=10, retries=3, timeout=30)
+    atexit.register(client.close)
+    return client
+
+
 class InfluxConnection:
     """Connect to influxdb and return connection."""
 
@@ -39,18 +97,16 @@ class InfluxConnection:
         """Connect to influxdb."""
         self.database = database
         self.reset = reset
+        self.influxdb = influx_client(database)
 
     @contextmanager
     def connect(self):
-        """Context manager that ensures the InfluxDB connection is closed."""
+        """Context manager that returns the shared InfluxDB client for the database.
+        The client is left open so that its connections are reused by later connections."""
         try:
-            influxdb_client = influxdb.InfluxDBClient(host='localhost', port=8086)
             if self.reset:
-                influxdb_client.drop_database(self.database)
-                influxdb_client.create_database(self.database)
-            influxdb_client.switch_database(self.database)
-            yield influxdb_client
+                self.influxdb.drop_database(self.database)
+                self.influxdb.create_database(self.database)
+            yield self.influxdb
         except (influxdb.exceptions.InfluxDBClientError, influxdb.exceptions.InfluxDBServerError) as err:
             raise SystemExit(err) from err
-        finally:
-            influxdb_client.close()